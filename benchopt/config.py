@@ -1,12 +1,13 @@
 import os
+import re
 import sys
+import json
 import stat
 import warnings
+import functools
 from pathlib import Path
 from collections.abc import Iterable
 
-import yaml
-
 BOOLEAN_STATES = {
     '1': True, 'yes': True, 'true': True, 'on': True,
     '0': False, 'no': False, 'false': False, 'off': False
@@ -164,34 +165,180 @@ The available options are:
 """
 
 
-def get_global_config_file():
-    "Return the global config file."
+@functools.lru_cache(maxsize=1)
+def _get_yaml():
+    """Import yaml on first use, preferring the libyaml C loader and dumper.
+
+    yaml is only needed when a config file is actually read or written, and
+    importing it is not free, so it is kept out of the module import path to
+    reduce the CLI startup time.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader
+        from yaml import SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+# Cache for parsed config files, keyed by path. Each entry stores the file's
+# mtime at parse time, so the file is only re-read and re-parsed when it
+# changes on disk. This avoids re-running `yaml.safe_load` for each call to
+# `get_setting`, in particular when evaluating `BooleanFlag` in hot loops.
+_CONFIG_CACHE = {}
+
+
+def _load_config_cached(config_file, use_json_cache=False):
+    """Return the parsed content of ``config_file`` as a dict, with caching.
+
+    The parsed config is cached at the module level and only re-loaded when
+    the file's mtime changes. Missing files simply resolve to an empty config.
+
+    When ``use_json_cache`` is set, a JSON sidecar mirroring the parse is
+    also maintained next to the file, to speed up cold-start reads. This is
+    only used for the global config file, so no cache file is dropped in
+    benchmark directories.
+    """
+    config_file = Path(config_file)
+    try:
+        st = config_file.stat()
+    except FileNotFoundError:
+        _CONFIG_CACHE.pop(config_file, None)
+        if use_json_cache:
+            # Make sure no stale sidecar outlives a deleted config file, as
+            # it mirrors its content (including e.g. tokens).
+            _drop_json_cache(config_file)
+        return {}
+    mtime = st.st_mtime_ns
+
+    # Empty file (e.g. a freshly touched config): no need to parse anything.
+    if st.st_size == 0:
+        _CONFIG_CACHE[config_file] = (mtime, {})
+        return {}
+
+    cached = _CONFIG_CACHE.get(config_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    config = None
+    if use_json_cache:
+        # On a cold start, prefer the JSON sidecar cache when it matches the
+        # YAML file's mtime, as parsing JSON is much faster than parsing YAML.
+        try:
+            with open(_json_cache_path(config_file), "r") as f:
+                payload = json.load(f)
+            if payload.get("mtime_ns") == mtime:
+                config = payload.get("config")
+        except (OSError, ValueError, AttributeError):
+            config = None
+
+    if config is None:
+        yaml, Loader, _ = _get_yaml()
+        with open(config_file, "r") as f:
+            config = yaml.load(f, Loader=Loader) or {}
+        if use_json_cache:
+            _write_json_cache(_json_cache_path(config_file), mtime, config)
+
+    _CONFIG_CACHE[config_file] = (mtime, config)
+    return config
+
+
+def _json_cache_path(config_file):
+    "Return the path of the JSON sidecar cache for a YAML config file."
+    return config_file.with_name(config_file.name + '.cache.json')
+
 
-    config_file = os.environ.get('BENCHOPT_CONFIG', None)
-    if config_file is not None:
-        config_file = Path(config_file)
-        assert config_file.exists(), (
+def _write_json_cache(cache_path, mtime, config):
+    """Write the JSON sidecar cache for a parsed config, best effort.
+
+    The sidecar mirrors the config content, so it is created with the same
+    restricted permissions as the global config file. The source file's mtime
+    is stored in the payload to detect staleness. Failures (read-only
+    directory, non-JSON-serializable content) simply skip the cache.
+    """
+    try:
+        if not cache_path.exists():
+            cache_path.touch(mode=GLOBAL_CONFIG_FILE_MODE)
+        with cache_path.open('w') as f:
+            json.dump({"mtime_ns": mtime, "config": config}, f)
+    except (OSError, TypeError):
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
+
+
+def _drop_json_cache(config_file):
+    "Remove the JSON sidecar cache of a config file, if any."
+    try:
+        _json_cache_path(config_file).unlink()
+    except OSError:
+        pass
+
+
+def _stat_or_none(path):
+    "Single-syscall existence check, returning the stat result or None."
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_global_config_file(env_config_file, cwd):
+    """Locate the global config file, memoized per env value and cwd.
+
+    The resolution walks the filesystem, so it is cached to avoid repeated
+    `stat` calls when `get_setting` is invoked in hot loops. The cache is
+    keyed on the `BENCHOPT_CONFIG` env var and the working directory so that
+    changing either of them is correctly taken into account.
+    """
+    if env_config_file is not None:
+        config_file = Path(env_config_file)
+        assert _stat_or_none(config_file) is not None, (
             f"BENCHOPT_CONFIG is set but file {config_file} does not exists.\n"
             f"It can be created with `touch {config_file.resolve()}`."
         )
     else:
 
         config_file = Path('.') / CONFIG_FILE_NAME
-        if not config_file.exists():
+        if _stat_or_none(config_file) is None:
             config_file = Path.home() / '.config' / CONFIG_FILE_NAME
 
+    return config_file
+
+
+# Keep track of the (path, mode) pairs that have already been warned about,
+# to only emit the permission warning once per offending mode.
+_PERM_WARNED = set()
+
+
+def get_global_config_file():
+    "Return the global config file."
+
+    config_file = _resolve_global_config_file(
+        os.environ.get('BENCHOPT_CONFIG', None), os.getcwd()
+    )
+
     # check that the global config file is only accessible to current user as
     # it stores critical information such as the github token.
     # On Windows, chmod does not support Unix permission bits, so skip.
-    if (sys.platform != 'win32' and config_file.exists()
-            and config_file.stat().st_mode != GLOBAL_CONFIG_FILE_MODE):
-        mode = oct(config_file.stat().st_mode)[5:]
-        expected_mode = oct(GLOBAL_CONFIG_FILE_MODE)[5:]
-        warnings.warn(
-            f"BenchOpt config file {config_file} is with mode {mode}.\n"
-            "As it stores sensitive information such as the github token,\n"
-            f"it is advised to use mode {expected_mode} (user rw only)."
-        )
+    if sys.platform != 'win32':
+        st = _stat_or_none(config_file)
+        st_mode = st.st_mode if st is not None else None
+        if (st_mode is not None and st_mode != GLOBAL_CONFIG_FILE_MODE
+                and (config_file, st_mode) not in _PERM_WARNED):
+            _PERM_WARNED.add((config_file, st_mode))
+            mode = oct(st_mode)[5:]
+            expected_mode = oct(GLOBAL_CONFIG_FILE_MODE)[5:]
+            warnings.warn(
+                f"BenchOpt config file {config_file} is with mode {mode}.\n"
+                "As it stores sensitive information such as the github "
+                "token,\n"
+                f"it is advised to use mode {expected_mode} (user rw only)."
+            )
 
     return config_file
 
@@ -216,25 +363,25 @@ def _check_settings(config_file=None, benchmark_name=None):
 
         global_config_file = get_global_config_file()
 
-        # Load the config from the yaml file if the file exists.
-        if global_config_file.exists():
-            with open(global_config_file, "r") as f:
-                config = yaml.safe_load(f) or {}
-            for key in config:
-                if key not in DEFAULT_GLOBAL_CONFIG:
-                    bench_config = config[key]
-                    if isinstance(bench_config, dict):
-                        # If this is a dict, check for benchmark config
-                        _check_bench_config(
-                            bench_config, f"{global_config_file}[{key}]"
-                        )
-                    else:
-                        # otherwise, warn for unknown config option
-                        warnings.warn(
-                            f"{key} is set in {global_config_file} but is not "
-                            "a valid option for benchopt. Options are:\n-"
-                            + "\n-".join(DEFAULT_GLOBAL_CONFIG)
-                        )
+        # Load the config from the yaml file if the file exists. The parse is
+        # shared with `get_setting` through the cache, so checking does not
+        # trigger a second read of the same file.
+        config = _load_config_cached(global_config_file, use_json_cache=True)
+        for key in config:
+            if key not in DEFAULT_GLOBAL_CONFIG:
+                bench_config = config[key]
+                if isinstance(bench_config, dict):
+                    # If this is a dict, check for benchmark config
+                    _check_bench_config(
+                        bench_config, f"{global_config_file}[{key}]"
+                    )
+                else:
+                    # otherwise, warn for unknown config option
+                    warnings.warn(
+                        f"{key} is set in {global_config_file} but is not "
+                        "a valid option for benchopt. Options are:\n-"
+                        + "\n-".join(DEFAULT_GLOBAL_CONFIG)
+                    )
 
         # Check for option set with environment variables
         for var in os.environ:
@@ -252,17 +399,16 @@ def _check_settings(config_file=None, benchmark_name=None):
 
     if DEFAULT_GLOBAL_CONFIG["_bench_config_check"]:
         return
-    if config_file.exists():
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f) or {}
-        _check_bench_config(config, config_file)
+    _check_bench_config(_load_config_cached(config_file), config_file)
 
 
 def set_setting(name, value, config_file=None, benchmark_name=None):
 
     _check_settings(config_file, benchmark_name)
 
-    if config_file is None:
+    # The JSON sidecar cache is only maintained for the global config file.
+    is_global_config = config_file is None
+    if is_global_config:
         config_file = get_global_config_file()
 
     # Get default value
@@ -278,25 +424,33 @@ def set_setting(name, value, config_file=None, benchmark_name=None):
         raise SystemExit(1)
     default_value = default_config[name]
 
-    # Load the config from the yaml file if the file exists.
-    config = {}
-    if config_file.exists():
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f) or {}
+    # Load the config from the yaml file if the file exists, sharing the
+    # parse with `get_setting`. Copy the dict -- including the nested
+    # benchmark dict below -- so the cached one is never mutated.
+    config = dict(_load_config_cached(
+        config_file, use_json_cache=is_global_config
+    ))
 
     if benchmark_name is not None:
-        if benchmark_name not in config:
-            config[benchmark_name] = {}
+        config[benchmark_name] = dict(config.get(benchmark_name, {}))
         config[benchmark_name][name] = reverse_parse(default_value, value)
     else:
         config[name] = reverse_parse(default_value, value)
 
     # Create config file with the correct permission.
-    if not config_file.exists():
+    if _stat_or_none(config_file) is None:
         config_file.touch(mode=GLOBAL_CONFIG_FILE_MODE)
 
+    yaml, _, Dumper = _get_yaml()
     with config_file.open('w') as f:
-        yaml.safe_dump(config, f)
+        yaml.dump(config, f, Dumper=Dumper)
+
+    # Invalidate the cached parses of this file so subsequent `get_setting`
+    # calls pick up the new value.
+    _CONFIG_CACHE.pop(Path(config_file), None)
+    if is_global_config:
+        _drop_json_cache(Path(config_file))
+    _refresh_all_flags()
 
 
 def get_setting(name, config_file=None, benchmark_name=None,
@@ -322,7 +476,9 @@ def get_setting(name, config_file=None, benchmark_name=None,
     # check that the settings are correctly set
     _check_settings(config_file, benchmark_name)
 
-    if config_file is None:
+    # The JSON sidecar cache is only maintained for the global config file.
+    is_global_config = config_file is None
+    if is_global_config:
         config_file = get_global_config_file()
 
     # Get default value
@@ -335,11 +491,15 @@ def get_setting(name, config_file=None, benchmark_name=None,
     default_config = {} if default_config is None else default_config
     default_value = default_config.get(name, default_config_[name])
 
+    # Fast path: an environment variable takes precedence over the config
+    # file, so no file access is needed at all when it is set.
+    env_var_name = f"BENCHOPT_{name.upper()}"
+    env_value = os.environ.get(env_var_name)
+    if env_value is not None:
+        return parse_value(env_value, default_value)
+
     # Load the config from the yaml file if the file exists.
-    config = {}
-    if config_file.exists():
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f) or {}
+    config = _load_config_cached(config_file, use_json_cache=is_global_config)
 
     # Get value from config file or keep the default value.
     if benchmark_name in config:
@@ -347,11 +507,6 @@ def get_setting(name, config_file=None, benchmark_name=None,
     else:
         value = config.get(name, default_value)
 
-    # Get the value for the environment variable or keep the value from config
-    # file or default.
-    env_var_name = f"BENCHOPT_{name.upper()}"
-    value = os.environ.get(env_var_name, value)
-
     # Parse the value to the correct type
     value = parse_value(value, default_value)
 
@@ -396,28 +551,60 @@ def get_data_path(key: str = None):
     return data_path.resolve()
 
 
+# Boolean lookup extended with the capitalized and uppercase spellings, so
+# that the common forms resolve with a single dict lookup, without allocating
+# a lowered copy of the string first.
+_BOOL_FAST = {
+    **BOOLEAN_STATES,
+    **{k.capitalize(): v for k, v in BOOLEAN_STATES.items()},
+    **{k.upper(): v for k, v in BOOLEAN_STATES.items()},
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_bool(value):
+    """Parse a string as a boolean, or None when it is not a valid one.
+
+    The set of possible values is tiny (a handful of bool config values),
+    so the parse is memoized to avoid re-doing it on hot paths.
+    """
+    value_bool = _BOOL_FAST.get(value)
+    if value_bool is None:
+        value_bool = BOOLEAN_STATES.get(value.lower())
+    return value_bool
+
+
+# Separators for list settings: any mix of whitespace and commas.
+_LIST_SPLIT_RE = re.compile(r'[\s,]+')
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_list(value):
+    """Parse a multiline statement as a list, with separators '\\n' and ','.
+
+    Memoized like `_parse_bool`; returns a tuple so the cached value is
+    immutable.
+    """
+    return tuple(v for v in _LIST_SPLIT_RE.split(value.strip()) if v)
+
+
 def parse_value(value, default_value):
     if isinstance(default_value, bool):
         # convert string 0/1/true/false/yes/no/on/off to boolean
         if isinstance(value, str):
-            value = value.lower()
-            try:
-                value = BOOLEAN_STATES[value]
-            except KeyError:
+            parsed = _parse_bool(value)
+            if parsed is None:
                 warnings.warn(
-                    f'setting {value} could not be parsed as a '
+                    f'setting {value.lower()} could not be parsed as a '
                     'boolean. Should be one of '
                     f'{list(BOOLEAN_STATES.keys())}'
                 )
-                value = default_value
+                parsed = default_value
+            value = parsed
         assert isinstance(value, bool)
     elif isinstance(default_value, list):
-        # parse multiline statements as list with separators '\n' and ','
         if isinstance(value, str):
-            values = value.split()
-            values = [v.strip() for value in values
-                      for v in value.split(',') if v != '']
-            value = values
+            value = list(_parse_list(value))
         assert isinstance(value, list), value
     elif isinstance(default_value, int):
         value = int(value)
@@ -444,14 +631,43 @@ def reverse_parse(default_value, value):
     return value
 
 
-# Make sure we load the lattest value of the config parameter, even if it is
-# changed. This should only be useful for testing purposes.
+# Registry of the BooleanFlag instances, to reset their cached values when
+# the config file is modified.
+_FLAGS = []
+
+
 class BooleanFlag(object):
+    """Boolean config flag, resolved lazily and cached.
+
+    The ``BENCHOPT_{NAME}`` environment variable takes precedence and is
+    checked on every evaluation, so flags can still be toggled dynamically,
+    in particular in tests. The value from the config file is only resolved
+    once and cached; it is refreshed when the setting is changed with
+    ``set_setting``.
+    """
     def __init__(self, name):
         self.name = name
+        self._cached = None
+        _FLAGS.append(self)
 
     def __bool__(self):
-        return get_setting(self.name)
+        # Fast path: env var override, a simple dict lookup with no disk I/O.
+        env_value = os.environ.get(f"BENCHOPT_{self.name.upper()}")
+        if env_value is not None:
+            return parse_value(env_value, DEFAULT_GLOBAL_CONFIG[self.name])
+        if self._cached is None:
+            self._cached = get_setting(self.name)
+        return self._cached
+
+    def refresh(self):
+        "Clear the cached value so it is re-read from the config file."
+        self._cached = None
+
+
+def _refresh_all_flags():
+    "Reset all flags' cached values, e.g. after the config file changed."
+    for flag in _FLAGS:
+        flag.refresh()
 
 
 DEBUG = BooleanFlag('debug')
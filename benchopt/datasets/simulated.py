@@ -105,7 +105,10 @@ def make_correlated_data(
     Y = X @ w_true
     noise = rng.randn(n_samples, n_tasks)
     if snr not in [0, np.inf]:
-        Y += noise / norm(noise) * norm(Y) / snr
+        # Collapse the scalar factors and scale the noise in place, to avoid
+        # materializing one intermediate array per factor.
+        noise *= norm(Y) / (snr * norm(noise))
+        Y += noise
     elif snr == 0:
         Y = noise
 
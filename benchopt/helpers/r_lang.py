@@ -15,7 +15,16 @@ except ImportError:
     )
 
 
+# One-shot guard for `setup_rpy2`: resolving R_HOME spawns an R subprocess,
+# so it should only be done once per process.
+_RPY2_SETUP_DONE = False
+
+
 def setup_rpy2():
+    global _RPY2_SETUP_DONE
+    if _RPY2_SETUP_DONE:
+        return
+
     import rpy2.situation
     import rpy2.robjects
 
@@ -25,6 +34,8 @@ def setup_rpy2():
     # Hide the R warnings
     rpy2.robjects.r['options'](warn=-1)
 
+    _RPY2_SETUP_DONE = True
+
 
 def get_package_not_installed_error():
     try:
@@ -61,7 +72,15 @@ def import_func_from_r_file(filename):
     return robjects
 
 
+# The combined converter is built once and reused: combining converters is
+# not free and `converter_ctx` is typically entered on every solver `run`.
+_CONVERTER = None
+
+
 def converter_ctx():
-    from rpy2.robjects import numpy2ri
-    from rpy2.robjects import default_converter
-    return (default_converter + numpy2ri.converter).context()
+    global _CONVERTER
+    if _CONVERTER is None:
+        from rpy2.robjects import numpy2ri
+        from rpy2.robjects import default_converter
+        _CONVERTER = default_converter + numpy2ri.converter
+    return _CONVERTER.context()
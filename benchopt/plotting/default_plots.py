@@ -39,8 +39,17 @@ class ObjectiveCurvePlot(BasePlot):
             )
 
             y = df_fill.groupby('stop_val').median(numeric_only=True)
+            time_quantiles = None
             if X_axis == "Iteration":
                 x = y.index
+            elif df_filtered['idx_rep'].nunique() > 1:
+                # Compute the median and the runtime quantiles in a single
+                # grouped pass over the times instead of two.
+                time_quantiles = (
+                    df_filtered.groupby('stop_val')['time']
+                    .quantile([.2, .5, .8]).unstack()
+                )
+                x = time_quantiles[.5]
             else:
                 x = df_filtered.groupby('stop_val')['time'].median()
 
@@ -51,14 +60,9 @@ class ObjectiveCurvePlot(BasePlot):
                 **self.get_style(solver)
             }
 
-            if X_axis == "Time" and df_filtered['idx_rep'].nunique() > 1:
-                # Compute the quantiles for runtime
-                q = (
-                    df_filtered.groupby('stop_val')['time'].quantile([.2, .8])
-                    .unstack()
-                )
-                curve_data['x_low'] = q[.2].tolist()
-                curve_data['x_high'] = q[.8].tolist()
+            if time_quantiles is not None:
+                curve_data['x_low'] = time_quantiles[.2].tolist()
+                curve_data['x_high'] = time_quantiles[.8].tolist()
 
             plots.append(curve_data)
 
@@ -221,10 +225,15 @@ class TablePlot(BasePlot):
 
         for solver, solver_df in df.groupby('solver_name'):
             solver_res = [solver]
+            # Only the final stop_val is reported, so restrict the median
+            # computation to that group and to the displayed columns instead
+            # of aggregating the full curve for all numeric columns.
+            last_stop_val = solver_df['stop_val'].max()
             median_vals = (
-               solver_df.groupby('stop_val')
-               .median(numeric_only=True).iloc[-1]
-            )[objective_cols + ['time']].to_list()
+                solver_df.loc[solver_df['stop_val'] == last_stop_val,
+                              objective_cols + ['time']]
+                .median(numeric_only=True).to_list()
+            )
 
             solver_res.extend(median_vals)
             rows.append(solver_res)
@@ -155,7 +155,7 @@ def get_metadata(df, plot_configs):
     # get objective description and use `obj_` instead of `objective_`
     # try-except block to preserve compatibility with benchopt <= v1.3.1
     try:
-        obj_description = df["obj_description"].unique()[0]
+        obj_description = df["obj_description"].iloc[0]
         metadata["obj_description"] = obj_description
     except KeyError:
         metadata["obj_description"] = ""
@@ -190,13 +190,13 @@ def get_sysinfo(df):
         if key in df:
             if key == 'platform':
                 return (
-                    str(df["platform"].unique()[0]) +
-                    str(df["platform-release"].unique()[0]) + "-" +
-                    str(df["platform-architecture"].unique()[0])
+                    str(df["platform"].iloc[0]) +
+                    str(df["platform-release"].iloc[0]) + "-" +
+                    str(df["platform-architecture"].iloc[0])
                 )
             else:
                 df['version-numpy'] = df['version-numpy'].astype(str)
-                val = df[key].unique()[0]
+                val = df[key].iloc[0]
                 if not pd.isnull(val):
                     return str(val)
                 return ''
@@ -1,10 +1,13 @@
 import os
 import sys
+import json
 import pytest
 import warnings
 from pathlib import Path
 from contextlib import contextmanager
 
+from benchopt.config import _CONFIG_CACHE
+from benchopt.config import _load_config_cached
 from benchopt.config import parse_value
 from benchopt.config import DEFAULT_GLOBAL_CONFIG
 from benchopt.config import DEFAULT_BENCHMARK_CONFIG
@@ -56,6 +59,10 @@ def temp_config_file(permission='600'):
         else:
             del os.environ['BENCHOPT_CONFIG']
         config_file.unlink()
+        # Also remove the JSON sidecar cache if one was generated.
+        config_file.with_name(
+            config_file.name + '.cache.json'
+        ).unlink(missing_ok=True)
 
 
 def test_parse_value():
@@ -137,6 +144,69 @@ def test_config_file_set(setting_key):
                     os.environ[KEY] = old_value
 
 
+def test_config_json_sidecar_cache():
+    with temp_config_file() as config_file:
+        sidecar = config_file.with_name(config_file.name + '.cache.json')
+        config_file.write_text("debug: true\n")
+
+        # Reading the global config generates a sidecar mirroring the parse.
+        assert get_setting('debug') is True
+        payload = json.loads(sidecar.read_text())
+        assert payload["config"] == {"debug": True}
+
+        # A cold process (no in-memory cache) reads from the sidecar.
+        _CONFIG_CACHE.clear()
+        assert get_setting('debug') is True
+
+        # A stale sidecar is ignored and regenerated when the file changes.
+        config_file.write_text("debug: false\n")
+        # Force a distinct mtime in case the filesystem timestamps are
+        # coarser than the time between the two writes.
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        _CONFIG_CACHE.clear()
+        assert get_setting('debug') is False
+        payload = json.loads(sidecar.read_text())
+        assert payload["config"] == {"debug": False}
+
+        # A corrupted sidecar falls back to parsing the YAML file.
+        no_config = '{"mtime_ns": %d}' % payload["mtime_ns"]
+        for corrupted in ['not json', no_config]:
+            sidecar.write_text(corrupted)
+            _CONFIG_CACHE.clear()
+            assert get_setting('debug') is False
+
+        # Writing a setting drops the sidecar so it cannot be stale.
+        set_setting('debug', True)
+        assert not sidecar.exists()
+        assert get_setting('debug') is True
+
+
+def test_config_sidecar_removed_with_config_file(tmp_path):
+    # Deleting the config file must also remove the sidecar, so scrubbed
+    # values (e.g. tokens) do not outlive the config.
+    config_file = tmp_path / "benchopt.yml"
+    config_file.write_text("github_token: secret\n")
+    _load_config_cached(config_file, use_json_cache=True)
+    sidecar = config_file.with_name(config_file.name + '.cache.json')
+    assert sidecar.exists()
+
+    config_file.unlink()
+    assert _load_config_cached(config_file, use_json_cache=True) == {}
+    assert not sidecar.exists()
+
+
+def test_benchmark_config_no_sidecar(tmp_path):
+    # No JSON sidecar should be dropped next to a benchmark's config file.
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("data_home: data\n")
+    value = get_setting(
+        "data_home", config_file=config_file, benchmark_name="bench"
+    )
+    assert value == "data"
+    assert list(tmp_path.iterdir()) == [config_file]
+
+
 def test_config_file_set_error():
     with temp_config_file():
         with pytest.raises(SystemExit):
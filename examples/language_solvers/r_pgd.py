@@ -21,15 +21,29 @@ class Solver(BaseSolver):
 
     parameters = {'lr': [1e-3, 1e-2]}
 
+    # Handle on the R function, shared at the class level. Sourcing the R
+    # file and looking up the function are global side effects on the R
+    # runtime that do not depend on the objective, so they are only done
+    # once instead of on every `set_objective` call.
+    _r_gd = None
+
+    @classmethod
+    def _ensure_r_setup(cls):
+        if cls._r_gd is None:
+            robjects = import_func_from_r_file(R_FILE)
+            cls._r_gd = robjects.r['gradient_descent']
+
     def set_objective(self, X):
-        self.X = X
-        robjects = import_func_from_r_file(R_FILE)
-        self.r_gd = robjects.r['gradient_descent']
+        self._ensure_r_setup()
+        # Convert X to an R matrix once here, so `run` does not pay the
+        # numpy-to-R copy of the full matrix on every call.
+        from rpy2.robjects import numpy2ri
+        self.X_r = numpy2ri.py2rpy(X)
 
     def run(self, n_iter):
         with converter_ctx():
-            coefs = self.r_gd(
-                self.X, self.lr, n_iter=n_iter
+            coefs = self._r_gd(
+                self.X_r, self.lr, n_iter=n_iter
             )
             self.X_hat = np.asarray(coefs)
 
@@ -40,7 +40,9 @@ class Solver(BaseSolver):
         iterations, the time and the evoluation of the performances.
         """
         while cb():
-            self.X_hat = self.X_hat - self.lr * (self.X_hat - self.X)
+            # Update the parameters in place to avoid reallocating X_hat at
+            # each iteration.
+            self.X_hat += self.lr * (self.X - self.X_hat)
 
     def get_result(self):
         """Format the output of the method to be evaluated in the Objective.